@@ -32,6 +32,7 @@ def boxsvg(WIDTH,
            DASHDENSITY=0,
            OUTFILENAME=None,
            SLOTWIDTH=1,
+           PREVIEWFILENAME=None,
            ):
     # WIDTH, HEIGHT, DEPTH - dimensions
     # OPENANBLEFLAP - width of flaps that will open (autocalculated if needed)
@@ -40,6 +41,7 @@ def boxsvg(WIDTH,
     # DASHDENSITY - percentage (-50..+50) offset of dashed lines' density
     # OUTFILENAME - with path for SVG
     # SLOTWIDTH - how wide will the slot be for the static flaps
+    # PREVIEWFILENAME - if given, also write a quick PNG preview there
 
     lines = []  # Collector of lines (master, to be forwarded to file later)
     # Autocalculate flaps
@@ -151,10 +153,14 @@ def boxsvg(WIDTH,
     import svggen
     if not OUTFILENAME: OUTFILENAME = 'boxsvg.svg'
     svggen.svggen(lines, OUTFILENAME, xoffset=DEPTH + CLOSEDFLAP, yoffset=DEPTH + OPENABLEFLAP)
+    if PREVIEWFILENAME:
+        import svgpreview
+        svgpreview.svgpreview(lines, PREVIEWFILENAME, xoffset=DEPTH + CLOSEDFLAP, yoffset=DEPTH + OPENABLEFLAP)
+    return lines
 
 ###########
 # Self test
 
 
 if __name__ == '__main__':
-    boxsvg(19, 52, 16, DASHES=5, DASHDENSITY=-15, )
+    boxsvg(19, 52, 16, DASHES=5, DASHDENSITY=-15, PREVIEWFILENAME='boxsvg.png')
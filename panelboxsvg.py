@@ -5,6 +5,7 @@ segments.
 '''
 
 import svggen
+import svgpreview
 import math
 
 
@@ -18,6 +19,7 @@ def boxsvg(
     bottomteeth=3,  # Number of teeth of the bottom panel (connecting to 4 sides)
     top=True,  # Include the top (lid) side?
     topteeth=2,  # Teeth for the top lid if used (can be 0 for non-meshing simple lid)
+    preview=None,  # If given, a PNG file to write a quick raster preview to
 ):
     # Firstly prepare the master line collector
     masterlines = []
@@ -87,6 +89,7 @@ def boxsvg(
 
     # Generated all geometry. Export
     if outfile: svggen.svggen(masterlines, outfile)
+    if preview: svgpreview.svgpreview(masterlines, preview)
     return masterlines
 
 
@@ -135,4 +138,4 @@ def getteeth(
 ### Self-test
 #############
 if __name__ == '__main__':
-    boxsvg(44, 36, 28, outfile='paneltest.svg')
+    boxsvg(44, 36, 28, outfile='paneltest.svg', preview='paneltest.png')
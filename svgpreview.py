@@ -0,0 +1,296 @@
+'''
+SVGPREVIEW
+Quick raster (PNG) preview of the same geometry lists that SVGGEN takes, without
+generating or parsing any SVG/XML on the way. Meant for thumbnails, so everything
+is drawn one pixel wide, straight into an RGB byte array.
+
+Example: same input as svggen, but a PNG (as bytes) comes out
+svgpreview([[1,2,3,4,'blue'],[5,6,7,'yellow','fill:red']],'preview.png',size=128)
+'''
+
+import struct
+import zlib
+
+import svggen
+
+# CONSTANTS
+
+PNGSIGNATURE = b'\x89PNG\r\n\x1a\n'
+BACKGROUND = (255, 255, 255)
+# Only the most usual CSS colors; anything unknown is drawn black
+NAMEDCOLORS = {
+    'black': (0, 0, 0), 'white': (255, 255, 255), 'red': (255, 0, 0),
+    'green': (0, 128, 0), 'lime': (0, 255, 0), 'blue': (0, 0, 255),
+    'yellow': (255, 255, 0), 'cyan': (0, 255, 255), 'aqua': (0, 255, 255),
+    'magenta': (255, 0, 255), 'fuchsia': (255, 0, 255), 'gray': (128, 128, 128),
+    'grey': (128, 128, 128), 'silver': (192, 192, 192), 'maroon': (128, 0, 0),
+    'olive': (128, 128, 0), 'navy': (0, 0, 128), 'purple': (128, 0, 128),
+    'teal': (0, 128, 128), 'orange': (255, 165, 0), 'brown': (165, 42, 42),
+}
+
+# Helper color parser
+
+
+def rgbparse(color):
+    '''
+    Gets a color as SVGGEN would write it (name, #rgb, #rrggbb or r,g,b) and
+    returns bytes of r,g,b. None if the color means no painting at all.
+    '''
+    color = svggen.colorparse(str(color)).strip().lower()
+    if color in ('none', 'transparent', ''): return None
+    if color.startswith('#'):
+        hexa = color[1:]
+        if len(hexa) == 3: hexa = ''.join([c * 2 for c in hexa])
+        if len(hexa) == 6:
+            try:
+                return bytes.fromhex(hexa)
+            except ValueError:
+                pass
+    return bytes(NAMEDCOLORS.get(color, (0, 0, 0)))
+
+# Canvas and drawing primitives
+
+
+class Canvas:
+    '''Plain RGB raster backed by a single bytearray, row after row.'''
+
+    def __init__(self, width, height, background=BACKGROUND):
+        self.width = width
+        self.height = height
+        self.pixels = bytearray(bytes(background) * (width * height))
+
+    def plot(self, x, y, color):
+        'Set a single pixel, silently ignoring anything off the canvas.'
+        if 0 <= x < self.width and 0 <= y < self.height:
+            pos = (y * self.width + x) * 3
+            self.pixels[pos:pos + 3] = color
+
+    def span(self, x1, x2, y, color):
+        'Horizontal run of pixels from x1 to x2 (inclusive) on row y.'
+        if not 0 <= y < self.height: return
+        x1 = max(x1, 0)
+        x2 = min(x2, self.width - 1)
+        if x2 < x1: return
+        pos = (y * self.width + x1) * 3
+        self.pixels[pos:pos + (x2 - x1 + 1) * 3] = color * (x2 - x1 + 1)
+
+    def line(self, x1, y1, x2, y2, color):
+        'Bresenham line between two integer points.'
+        dx = abs(x2 - x1)
+        dy = -abs(y2 - y1)
+        sx = 1 if x1 < x2 else -1
+        sy = 1 if y1 < y2 else -1
+        err = dx + dy
+        while True:
+            self.plot(x1, y1, color)
+            if x1 == x2 and y1 == y2: break
+            e2 = 2 * err
+            if e2 >= dy:
+                err += dy
+                x1 += sx
+            if e2 <= dx:
+                err += dx
+                y1 += sy
+
+    def circle(self, cx, cy, r, stroke, fill):
+        'Midpoint circle, optionally filled with horizontal spans.'
+        # Collect one octant first, so the outline can go over the finished fill
+        octant = []
+        x, y = r, 0
+        err = 1 - r
+        while x >= y:
+            octant.append((x, y))
+            y += 1
+            if err < 0:
+                err += 2 * y + 1
+            else:
+                x -= 1
+                err += 2 * (y - x) + 1
+        if fill:
+            for x, y in octant:
+                self.span(cx - x, cx + x, cy + y, fill)
+                self.span(cx - x, cx + x, cy - y, fill)
+                self.span(cx - y, cx + y, cy + x, fill)
+                self.span(cx - y, cx + y, cy - x, fill)
+        if stroke:
+            for x, y in octant:
+                for px, py in ((x, y), (y, x), (-y, x), (-x, y),
+                               (-x, -y), (-y, -x), (y, -x), (x, -y)):
+                    self.plot(cx + px, cy + py, stroke)
+
+    def polygon(self, points, color):
+        'Scanline fill of a closed polygon, even-odd rule like the SVG header.'
+        ys = [p[1] for p in points]
+        edges = list(zip(points, points[1:] + points[:1]))
+        for row in range(max(int(min(ys)), 0), min(int(max(ys)) + 1, self.height)):
+            scan = row + .5  # Sample at pixel centers
+            crossings = []
+            for (x1, y1), (x2, y2) in edges:
+                if (y1 <= scan) != (y2 <= scan):
+                    crossings.append(x1 + (scan - y1) * (x2 - x1) / (y2 - y1))
+            crossings.sort()
+            for c in range(0, len(crossings) - 1, 2):
+                self.span(int(round(crossings[c])), int(round(crossings[c + 1])) - 1, row, color)
+
+    def png(self, level=1):
+        'Encode as an 8-bit RGB PNG and return the bytes.'
+        stride = self.width * 3
+        raw = b''.join([b'\x00' + self.pixels[r * stride:(r + 1) * stride]
+                        for r in range(self.height)])
+
+        def chunk(kind, data):
+            return struct.pack('>I', len(data)) + kind + data + \
+                struct.pack('>I', zlib.crc32(kind + data) & 0xffffffff)
+
+        header = struct.pack('>IIBBBBB', self.width, self.height, 8, 2, 0, 0, 0)
+        return PNGSIGNATURE + chunk(b'IHDR', header) + \
+            chunk(b'IDAT', zlib.compress(raw, level)) + chunk(b'IEND', b'')
+
+
+# MAIN FUNCTION
+
+
+def svgpreview(
+    vertices,  # List of lists of coordinates and parameters, exactly as for svggen
+    filename=None,  # If given, a filename to write the PNG to
+    xoffset=0,  # Offset of the entire drawing horizontally
+    yoffset=0,  # Offset of the entire drawing vertically
+    zoom=1,  # Multiplier of all coordinates (thus, a zoomer)
+    window=None,  # x,y (or x1,y1,x2,y2) of viewport. Subjected to zoom & offset
+    size=256,  # Longer side of the resulting image, in pixels
+    fill='none',
+    linecolor='black',
+    autoclosepoly=True,  # Closed paths get filled as polygons (if a fill is given)
+):
+    # Collected shapes as (kind, points in SVG units, stroke, fill)
+    shapes = []
+    viewport = []
+
+    for shape in vertices:
+        stroke = rgbparse(linecolor)
+        shapefill = rgbparse(fill)
+        parameters = dict()
+        # Separate 'parameter:value' strings from numbers without touching the input
+        coords = []
+        for item in shape:
+            if not isinstance(item, str):
+                coords.append(item)
+                continue
+            if ':' not in item: item = 'stroke:' + item  # Backward compatibility
+            pname, tmp, pvalue = item.partition(':')
+            parameters[pname] = pvalue
+        if 'stroke' in parameters: stroke = rgbparse(parameters['stroke'])
+        if 'fill' in parameters: shapefill = rgbparse(parameters['fill'])
+
+        # Text goes through the very same vector font generator
+        if 'text' in parameters:
+            for subline in svggen.genvectortext(coords, parameters):
+                # Note text is not subjected to zoom & offset in svggen either
+                shapes.append(('line', [tuple(p) for p in subline], stroke, None))
+                viewport.extend(subline)
+            continue
+
+        # Circle as X, Y, R
+        if len(coords) == 3 and not isinstance(coords[0], (list, tuple)):
+            cx, cy, cr = coords
+            cx = cx * zoom + xoffset
+            cy = cy * zoom + yoffset
+            cr = cr * zoom
+            shapes.append(('circle', [(cx, cy, cr)], stroke, shapefill))
+            viewport.append((cx - cr, cy - cr))
+            viewport.append((cx + cr, cy + cr))
+            continue
+
+        # Flatten out if needed
+        if coords and isinstance(coords[0], (list, tuple)):
+            collector = []
+            [collector.extend([x, y]) for x, y in coords]
+            coords = collector
+        if len(coords) % 2 or not coords:
+            print('Shape has odd number of vertex coordinates! Skipping', shape)
+            continue
+
+        points = [(coords[p] * zoom + xoffset, coords[p + 1] * zoom + yoffset)
+                  for p in range(0, len(coords), 2)]
+        viewport.extend(points)
+        # Closed polylines become polygons, open ones still get filled like in SVG
+        if len(points) > 2 and points[0] == points[-1] and autoclosepoly:
+            shapes.append(('polygon', points[:-1], stroke, shapefill))
+        elif len(points) > 2:
+            shapes.append(('polyline', points, stroke, shapefill))
+        else:
+            shapes.append(('line', points, stroke, None))
+
+    # Viewport, determined the same way svggen does it. Note svggen writes maxx and
+    # maxy as the viewBox width and height (not the far edges), and offsets all four
+    # window values by xoffset; both are kept so the framing matches the SVG
+    if window and len(window) == 4:
+        minx, miny = window[0] * zoom + xoffset, window[1] * zoom + xoffset
+        maxx, maxy = window[2] * zoom + xoffset, window[3] * zoom + xoffset
+    elif window:
+        minx, miny = xoffset, yoffset
+        maxx, maxy = window[0] * zoom + xoffset, window[1] * zoom + yoffset
+    else:
+        minx = min([0] + [p[0] for p in viewport])
+        miny = min([0] + [p[1] for p in viewport])
+        maxx = max([p[0] for p in viewport])
+        maxy = max([p[1] for p in viewport])
+
+    # Fit the viewBox into size x size pixels, keeping the aspect ratio
+    scale = (size - 1) / max(maxx, maxy, 1e-9)
+    canvas = Canvas(max(int(maxx * scale) + 1, 1),
+                    max(int(maxy * scale) + 1, 1))
+
+    def topixel(x, y):
+        return int(round((x - minx) * scale)), int(round((y - miny) * scale))
+
+    # Draw everything in the original order, so later shapes cover earlier ones
+    for kind, points, stroke, shapefill in shapes:
+        if kind == 'circle':
+            cx, cy, cr = points[0]
+            cx, cy = topixel(cx, cy)
+            canvas.circle(cx, cy, int(round(cr * scale)), stroke, shapefill)
+            continue
+        if kind in ('polygon', 'polyline') and shapefill:
+            # Filled as if closed, in both cases
+            canvas.polygon([((x - minx) * scale, (y - miny) * scale) for x, y in points], shapefill)
+        if kind == 'polygon':
+            points = points + points[:1]  # Close the outline too
+        if not stroke: continue
+        pixels = [topixel(x, y) for x, y in points]
+        for p in range(len(pixels) - 1):
+            canvas.line(*pixels[p], *pixels[p + 1], stroke)
+
+    finalpng = canvas.png()
+
+    # Save to disk if needed
+    if filename:
+        outf = open(filename, 'wb')
+        outf.write(finalpng)
+        outf.close()
+
+    # All done
+    return finalpng
+
+
+# Self-test
+#############
+if __name__ == '__main__':
+    import time
+    import panelboxsvg
+    start = time.perf_counter()
+    svgpreview(panelboxsvg.boxsvg(44, 36, 28), 'paneltest.png', size=128)
+    print('Panel box preview in {0:.1f} ms'.format((time.perf_counter() - start) * 1000))
+    svgpreview([[11, 12, 5, 'blue', 'fill:red'],
+                [1, 2, 3, 4, '255,0,255'],
+                [[5, 6], [10, 8], [9, 10], '#00FFFF'],
+                [14, 15, 17, 16, 18, 18, 'fill:red', 13, 21, 14, 15, '#3377FF'],
+                ], 'test.png')
+    # Filled circle must keep its whole outline on top of the fill
+    black, red = rgbparse('black'), rgbparse('red')
+    canvas = Canvas(25, 25)
+    canvas.circle(12, 12, 10, black, red)
+    toprow = [bytes(canvas.pixels[(2 * 25 + x) * 3:(2 * 25 + x) * 3 + 3]) for x in range(25)]
+    assert red not in toprow and black in toprow, 'Circle outline covered by fill'
+    svgpreview([[12, 12, 10, 'black', 'fill:red']], 'circle.png', size=25)
+    print('Filled circle OK')